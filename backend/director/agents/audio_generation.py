@@ -6,13 +6,13 @@ from typing import Optional
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import Session, TextContent, MsgStatus
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 from director.tools.elevenlabs import (
     ElevenLabsTool,
     PARAMS_CONFIG as ELEVENLABS_PARAMS_CONFIG,
 )
 
-from director.constants import DOWNLOADS_PATH
+from director.constants import get_downloads_path
 
 logger = logging.getLogger(__name__)
 
@@ -110,7 +110,7 @@ class AudioGenerationAgent(BaseAgent):
         :rtype: AgentResponse
         """
         try:
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.videodb_tool = get_videodb_tool(collection_id)
 
             if engine not in SUPPORTED_ENGINES:
                 raise Exception(f"{engine} not supported")
@@ -122,9 +122,8 @@ class AudioGenerationAgent(BaseAgent):
                 audio_gen_tool = ElevenLabsTool(api_key=ELEVENLABS_API_KEY)
                 config_key = "elevenlabs_config"
 
-            os.makedirs(DOWNLOADS_PATH, exist_ok=True)
             output_file_name = f"audio_{job_type}_{str(uuid.uuid4())}.mp3"
-            output_path = f"{DOWNLOADS_PATH}/{output_file_name}"
+            output_path = f"{get_downloads_path()}/{output_file_name}"
 
             if job_type == "sound_effect":
                 prompt = sound_effect.get("prompt")
@@ -177,7 +176,6 @@ class AudioGenerationAgent(BaseAgent):
                     """,
                 )
             self.output_message.content.append(text_content)
-            self.output_message.push_update()
             self.output_message.publish()
 
         except Exception as e:
@@ -188,7 +186,6 @@ class AudioGenerationAgent(BaseAgent):
                 status_message="Failed to generate audio",
             )
             self.output_message.content.append(text_content)
-            self.output_message.push_update()
             self.output_message.publish()
             return AgentResponse(status=AgentStatus.ERROR, message=str(e))
 
@@ -1,14 +1,18 @@
 import logging
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pydantic import BaseModel
 
 from openai_function_calling import FunctionInferrer
 
 from director.core.session import Session, OutputMessage
+from director.llm import get_default_llm
 
 logger = logging.getLogger(__name__)
 
+_inferred_parameters = {}
+
 
 class AgentStatus:
     SUCCESS = "success"
@@ -30,8 +34,20 @@ class BaseAgent(ABC):
         self.session: Session = session
         self.output_message: OutputMessage = self.session.output_message
 
+    @cached_property
+    def llm(self):
+        """LLM used by the agent, created on first use so agents that never
+        call it don't construct a client."""
+        return get_default_llm()
+
     def get_parameters(self):
-        """Return the automatically inferred parameters for the function using the dcstring of the function."""
+        """Return the automatically inferred parameters for the function using the dcstring of the function.
+
+        The result is cached per agent class, since agents are created for every chat but their run signature never changes.
+        """
+        parameters = _inferred_parameters.get(type(self))
+        if parameters:
+            return parameters
         function_inferrer = FunctionInferrer.infer_from_function_reference(self.run)
         function_json = function_inferrer.to_json_schema()
         parameters = function_json.get("parameters")
@@ -39,6 +55,7 @@ class BaseAgent(ABC):
             raise Exception(
                 "Failed to infere parameters, please define JSON instead of using this automated util."
             )
+        _inferred_parameters[type(self)] = parameters
         return parameters
 
     def to_llm_format(self):
@@ -3,7 +3,7 @@ import logging
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import Session, MsgStatus, VideoContent, VideoData
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +63,7 @@ class BrandkitAgent(BaseAgent):
             )
             self.output_message.content.append(video_content)
             self.output_message.push_update()
-            videodb_tool = VideoDBTool(collection_id=collection_id)
+            videodb_tool = get_videodb_tool(collection_id)
             brandkit_stream = videodb_tool.add_brandkit(
                 video_id, intro_video_id, outro_video_id, brand_image_id
             )
@@ -2,7 +2,7 @@ import logging
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import Session, TextContent, MsgStatus
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,7 @@ class DownloadAgent(BaseAgent):
             text_content.status_message = "Downloading.."
             self.output_message.content.append(text_content)
             self.output_message.push_update()
-            videodb_tool = VideoDBTool()
+            videodb_tool = get_videodb_tool()
             download_response = videodb_tool.download(stream_link, name)
             if download_response.get("status") == "done":
                 download_url = download_response.get("download_url")
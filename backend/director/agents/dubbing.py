@@ -1,15 +1,20 @@
 import logging
 import os
 
-from director.constants import DOWNLOADS_PATH
+from dotenv import load_dotenv
+
+from director.constants import get_downloads_path
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import Session, VideoContent, MsgStatus, VideoData
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 from director.tools.elevenlabs import ElevenLabsTool
 
+load_dotenv()
 logger = logging.getLogger(__name__)
 
+ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
+
 SUPPORTED_ENGINES = ["elevenlabs"]
 DUBBING_AGENT_PARAMETERS = {
     "type": "object",
@@ -83,17 +88,25 @@ class DubbingAgent(BaseAgent):
         :return: The response containing information about the dubbing operation.
         :rtype: AgentResponse
         """
+        if engine not in SUPPORTED_ENGINES:
+            return AgentResponse(
+                status=AgentStatus.ERROR,
+                message=f"Failed to dub video: {engine} not supported",
+            )
+        if engine == "elevenlabs" and not ELEVENLABS_API_KEY:
+            return AgentResponse(
+                status=AgentStatus.ERROR,
+                message="Failed to dub video: Elevenlabs API key not present in .env",
+            )
+
         try:
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.videodb_tool = get_videodb_tool(collection_id)
 
             # Get video audio file
             video = self.videodb_tool.get_video(video_id)
             if not video:
                 raise Exception(f"Video {video_id} not found")
 
-            if engine not in SUPPORTED_ENGINES:
-                raise Exception(f"{engine} not supported")
-
             video_content = VideoContent(
                 agent_name=self.agent_name,
                 status=MsgStatus.progress,
@@ -105,48 +118,46 @@ class DubbingAgent(BaseAgent):
 
             download_response = self.videodb_tool.download(video["stream_url"])
 
-            os.makedirs(DOWNLOADS_PATH, exist_ok=True)
-            dubbed_file_path = f"{DOWNLOADS_PATH}/{video_id}_dubbed.mp4"
-
-            if engine == "elevenlabs":
-                ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-                if not ELEVENLABS_API_KEY:
-                    raise Exception("Elevenlabs API key not present in .env")
-                elevenlabs_tool = ElevenLabsTool(api_key=ELEVENLABS_API_KEY)
-                job_id = elevenlabs_tool.create_dub_job(
-                    source_url=download_response["download_url"],
-                    target_language=target_language_code,
-                )
-                self.output_message.actions.append(
-                    f"Dubbing job initiated with Job ID: {job_id}"
-                )
-                self.output_message.push_update()
-
-                self.output_message.actions.append(
-                    "Waiting for dubbing process to complete.."
-                )
-                self.output_message.push_update()
-                elevenlabs_tool.wait_for_dub_job(job_id)
-
-                self.output_message.actions.append("Downloading dubbed video")
-                self.output_message.push_update()
-                elevenlabs_tool.download_dub_file(
-                    job_id,
-                    target_language_code,
+            dubbed_file_path = f"{get_downloads_path()}/{video_id}_dubbed.mp4"
+
+            try:
+                if engine == "elevenlabs":
+                    elevenlabs_tool = ElevenLabsTool(api_key=ELEVENLABS_API_KEY)
+                    job_id = elevenlabs_tool.create_dub_job(
+                        source_url=download_response["download_url"],
+                        target_language=target_language_code,
+                    )
+                    self.output_message.actions.append(
+                        f"Dubbing job initiated with Job ID: {job_id}"
+                    )
+                    self.output_message.actions.append(
+                        "Waiting for dubbing process to complete.."
+                    )
+                    self.output_message.push_update()
+                    elevenlabs_tool.wait_for_dub_job(job_id)
+
+                    self.output_message.actions.append("Downloading dubbed video")
+                    self.output_message.push_update()
+                    elevenlabs_tool.download_dub_file(
+                        job_id,
+                        target_language_code,
+                        dubbed_file_path,
+                    )
+
+                    self.output_message.actions.append(
+                        f"Uploading dubbed video to VideoDB as '[Dubbed in {target_language}] {video['name']}'"
+                    )
+                    self.output_message.push_update()
+
+                dubbed_video = self.videodb_tool.upload(
                     dubbed_file_path,
+                    source_type="file_path",
+                    media_type="video",
+                    name=f"[Dubbed in {target_language}] {video['name']}",
                 )
-
-                self.output_message.actions.append(
-                    f"Uploading dubbed video to VideoDB as '[Dubbed in {target_language}] {video['name']}'"
-                )
-                self.output_message.push_update()
-
-            dubbed_video = self.videodb_tool.upload(
-                dubbed_file_path,
-                source_type="file_path",
-                media_type="video",
-                name=f"[Dubbed in {target_language}] {video['name']}",
-            )
+            finally:
+                if os.path.exists(dubbed_file_path):
+                    os.remove(dubbed_file_path)
 
             video_content.video = VideoData(stream_url=dubbed_video["stream_url"])
             video_content.status = MsgStatus.success
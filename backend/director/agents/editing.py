@@ -1,4 +1,8 @@
 import logging
+import concurrent.futures
+
+from functools import lru_cache
+
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import (
     Session,
@@ -6,12 +10,20 @@ from director.core.session import (
     VideoData,
     MsgStatus,
 )
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 from videodb.asset import VideoAsset, AudioAsset
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1024)
+def get_audio_length(collection_id, audio_id):
+    """Get the length of an audio in seconds. Cached, as an audio's length
+    never changes and the same tracks get reused across edits."""
+    return float(get_videodb_tool(collection_id).get_audio(audio_id)["length"])
+
+
 EDITING_AGENT_PARAMETERS = {
     "type": "object",
     "properties": {
@@ -83,8 +95,28 @@ class EditingAgent(BaseAgent):
     def add_media_to_timeline(self, media_list, media_type):
         """Helper method to add media assets to timeline"""
         seeker = 0
+        audio_lengths = {}
+        if media_type == "audio":
+            # Trimmed clips carry their own duration, only the untrimmed ones
+            # need their length from VideoDB. Fetch each distinct audio once,
+            # in parallel.
+            untrimmed_ids = list(
+                dict.fromkeys(
+                    media["id"] for media in media_list if media.get("end") is None
+                )
+            )
+            if untrimmed_ids:
+                with concurrent.futures.ThreadPoolExecutor() as executor:
+                    lengths = executor.map(
+                        lambda audio_id: get_audio_length(
+                            self.collection_id, audio_id
+                        ),
+                        untrimmed_ids,
+                    )
+                    audio_lengths = dict(zip(untrimmed_ids, lengths))
+
         for media in media_list:
-            start = media.get("start", 0)
+            start = media.get("start") or 0
             end = media.get("end", None)
 
             if media_type == "video":
@@ -92,14 +124,16 @@ class EditingAgent(BaseAgent):
                 self.timeline.add_inline(asset)
 
             elif media_type == "audio":
-                audio = self.videodb_tool.get_audio(media["id"])
                 asset = AudioAsset(
                     asset_id=media["id"],
                     start=start,
                     end=end,
                 )
                 self.timeline.add_overlay(seeker, asset)
-                seeker += float(audio["length"])
+                if end is not None:
+                    seeker += end - start
+                else:
+                    seeker += audio_lengths[media["id"]] - start
             else:
                 raise ValueError(f"Invalid media type: {media_type}")
 
@@ -123,7 +157,8 @@ class EditingAgent(BaseAgent):
         """
         try:
             # Initialize first video's collection
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.collection_id = collection_id
+            self.videodb_tool = get_videodb_tool(collection_id)
 
             self.output_message.actions.append("Starting video editing process")
             video_content = VideoContent(
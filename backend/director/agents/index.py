@@ -3,7 +3,7 @@ import logging
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 
 from director.core.session import Session
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,11 @@ EXTRACTION_CONFIGS_DEFAULTS = {
     },
 }
 
+SCENE_INDEX_CONFIG_KEYS = {
+    "shot": "shot_based_config",
+    "time": "time_based_config",
+}
+
 SCENE_INDEX_CONFIG_DEFAULTS = {
     "type": "shot",
     "shot_based_config": EXTRACTION_CONFIGS_DEFAULTS["shot"],
@@ -241,9 +246,9 @@ class IndexAgent(BaseAgent):
         try:
             scene_data = {}
             if collection_id is None:
-                self.videodb_tool = VideoDBTool()
+                self.videodb_tool = get_videodb_tool()
             else:
-                self.videodb_tool = VideoDBTool(collection_id=collection_id)
+                self.videodb_tool = get_videodb_tool(collection_id)
             self.output_message.actions.append(f"Indexing {index_type} for video..")
             self.output_message.push_update()
 
@@ -252,11 +257,13 @@ class IndexAgent(BaseAgent):
 
             elif index_type == "scene":
                 scene_index_type = scene_index_config["type"]
+                if scene_index_type not in SCENE_INDEX_CONFIG_KEYS:
+                    raise ValueError(f"Invalid scene index type: {scene_index_type}")
                 scene_index_model_name = scene_index_config.get(
                     "model_name", "gpt4-o"
                 )
                 scene_index_config = scene_index_config[
-                    scene_index_type + "_based_config"
+                    SCENE_INDEX_CONFIG_KEYS[scene_index_type]
                 ]
                 scene_index_id = self.videodb_tool.index_scene(
                     video_id=video_id,
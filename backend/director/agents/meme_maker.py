@@ -1,7 +1,10 @@
 import logging
 import json
+import bisect
 import concurrent.futures
 
+from functools import lru_cache
+
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import (
     Session,
@@ -11,11 +14,74 @@ from director.core.session import (
     VideoContent,
     VideoData,
 )
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 from director.llm import get_default_llm
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds on concurrent LLM calls and stream generations per run, to stay
+# clear of rate limits.
+MAX_INFLIGHT_PROMPTS = 8
+MAX_INFLIGHT_STREAMS = 8
+
+# Shared by all MemeMaker runs, so threads are not spun up per run. Each run
+# keeps itself within MAX_INFLIGHT_PROMPTS and MAX_INFLIGHT_STREAMS.
+executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=MAX_INFLIGHT_PROMPTS + MAX_INFLIGHT_STREAMS,
+    thread_name_prefix="meme_maker",
+)
+
+
+@lru_cache(maxsize=1)
+def get_shared_llm():
+    """Get the LLM shared by all MemeMaker runs, so their many parallel calls
+    reuse one client's connection pool."""
+    return get_default_llm()
+
+
+# Fixed parts of the prompt sent for each chunk, the chunk's docs and the user
+# prompt go in between.
+MEME_PROMPT_HEAD = """
+            Input Format:
+                You are given visual and spoken information of the video of each second, and a transcipt of what's being spoken along with timestamp.
+            
+            Task: Analyze video content to identify peak Meme potential clip and images by evaluating:
+                1. Memeable Moments
+                    - Reaction-worthy facial expressions
+                    - Quotable one-liners or catchphrases
+                    - Unexpected or comedic timing
+                    - Relatable human moments
+                    - Visual gags or physical humor
+
+                2. Meme Format Compatibility
+                    - Reaction meme potential
+                    - Image macro possibilities
+                    - Multi-panel story potential
+                    - GIF-worthy sequences
+                    - Exploitable templates
+
+                3. Virality Indicators
+                    - Universal humor/relatability
+                    - Clear emotional response triggers
+                    - Easy to remix/recontextualize
+                    - Cultural reference potential
+                    - Distinct visual hooks
+
+            Multimodal Data:
+            video: """
+
+MEME_PROMPT_TAIL = """
+
+        
+            
+            **Output Format**: Return a JSON that containes the  fileds `clip_timestamps` and `image_timestamps`.
+            clip_timestamps is from the visual section of the input.
+            image_timestamps is the timestamp of the image in the visual section.
+            Ensure the final output strictly adheres to the JSON format specified without including additional text, explanations or any extra characters.
+            If there is no match return empty list without additional text. Use the following structure for your response:
+            {"clip_timestamps": [{"start": start timestamp of the clip, "end": end timestamp of the clip, "text":  "text content of the clip"}], "image_timestamps": [timestamp of the image]}
+            """
+
 MEMEMAKER_PARAMETERS = {
     "type": "object",
     "properties": {
@@ -41,9 +107,12 @@ class MemeMakerAgent(BaseAgent):
         self.agent_name = "meme_maker"
         self.description = "Generates meme clips and images based on user prompts. This agent usages LLM to analyze the transcript and visual content of the video to generate memes."
         self.parameters = MEMEMAKER_PARAMETERS
-        self.llm = get_default_llm()
         super().__init__(session=session, **kwargs)
 
+    @property
+    def llm(self):
+        return get_shared_llm()
+
     def _chunk_docs(self, docs, chunk_size):
         """
         chunk docs to fit into context of your LLM
@@ -54,24 +123,40 @@ class MemeMakerAgent(BaseAgent):
         for i in range(0, len(docs), chunk_size):
             yield docs[i : i + chunk_size]  # Yield the current chunk
 
-    def _filter_transcript(self, transcript, start, end):
-        result = []
-        for entry in transcript:
-            if float(entry["end"]) > start and float(entry["start"]) < end:
-                result.append(entry)
-        return result
+    def _filter_transcript(self, transcript, starts, ends, start, end):
+        """Get the transcript entries overlapping start and end. Entries are in
+        time order, so the overlapping ones are a contiguous run found by
+        bisecting their start and end times."""
+        return transcript[
+            bisect.bisect_right(ends, start) : bisect.bisect_left(starts, end)
+        ]
 
     def _get_multimodal_docs(self, transcript, scenes, club_on="scene"):
         # TODO: Implement club on transcript
         docs = []
         if club_on == "scene":
+            starts = [entry["start"] for entry in transcript]
+            ends = [entry["end"] for entry in transcript]
             for scene in scenes:
                 spoken_result = self._filter_transcript(
-                    transcript, float(scene["start"]), float(scene["end"])
+                    transcript, starts, ends, scene["start"], scene["end"]
                 )
                 spoken_text = " ".join(
                     entry["text"] for entry in spoken_result if entry["text"] != "-"
                 )
+                # Scenes where nothing is seen or said can't make a meme, and
+                # back-to-back identical scenes (e.g. a static shot split in
+                # several) are sent as one.
+                if not spoken_text.strip() and not (scene["description"] or "").strip():
+                    continue
+                if (
+                    docs
+                    and docs[-1]["end"] == scene["start"]
+                    and docs[-1]["visual"] == scene["description"]
+                    and docs[-1]["spoken"] == spoken_text
+                ):
+                    docs[-1]["end"] = scene["end"]
+                    continue
                 data = {
                     "visual": scene["description"],
                     "spoken": spoken_text,
@@ -81,20 +166,32 @@ class MemeMakerAgent(BaseAgent):
                 docs.append(data)
         return docs
 
-    def _prompt_runner(self, prompts):
-        """Run the prompts in parallel."""
+    def _prompt_runner(self, prompts, max_inflight=MAX_INFLIGHT_PROMPTS):
+        """Run the prompts in parallel, keeping at most max_inflight of them in
+        flight and only pulling the next prompt when one completes."""
         clip_timestamps = []
         image_timestamps = []
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_index = {
-                executor.submit(
-                    self.llm.chat_completions,
-                    [ContextMessage(content=prompt, role=RoleTypes.user).to_llm_msg()],
-                    response_format={"type": "json_object"},
-                ): i
-                for i, prompt in enumerate(prompts)
-            }
-            for future in concurrent.futures.as_completed(future_to_index):
+        prompts = iter(prompts)
+
+        def submit_next():
+            prompt = next(prompts, None)
+            if prompt is None:
+                return None
+            return executor.submit(
+                self.llm.chat_completions,
+                [ContextMessage(content=prompt, role=RoleTypes.user).to_llm_msg()],
+                response_format={"type": "json_object"},
+            )
+
+        pending = {submit_next() for _ in range(max_inflight)} - {None}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                next_future = submit_next()
+                if next_future:
+                    pending.add(next_future)
                 try:
                     llm_response = future.result()
                     if not llm_response.status:
@@ -111,58 +208,33 @@ class MemeMakerAgent(BaseAgent):
             "image_timestamps": image_timestamps,
         }
 
+    def _chunk_prompts(self, chunks, prompt):
+        """Build the LLM prompt for each chunk lazily, so prompts are only
+        created as the runner is ready to send them."""
+        for chunk in chunks:
+            yield "".join(
+                [
+                    MEME_PROMPT_HEAD,
+                    json.dumps(chunk, ensure_ascii=False),
+                    "\n            User Prompt: ",
+                    prompt,
+                    MEME_PROMPT_TAIL,
+                ]
+            )
+
     def _multimodal_prompter(self, transcript, scene_index, prompt):
         docs = self._get_multimodal_docs(transcript, scene_index)
         chunk_size = 80
         chunks = self._chunk_docs(docs, chunk_size=chunk_size)
+        return self._prompt_runner(self._chunk_prompts(chunks, prompt))
 
-        prompts = []
-        i = 0
-        for chunk in chunks:
-            chunk_prompt = f"""
-            Input Format:
-                You are given visual and spoken information of the video of each second, and a transcipt of what's being spoken along with timestamp.
-            
-            Task: Analyze video content to identify peak Meme potential clip and images by evaluating:
-                1. Memeable Moments
-                    - Reaction-worthy facial expressions
-                    - Quotable one-liners or catchphrases
-                    - Unexpected or comedic timing
-                    - Relatable human moments
-                    - Visual gags or physical humor
-
-                2. Meme Format Compatibility
-                    - Reaction meme potential
-                    - Image macro possibilities
-                    - Multi-panel story potential
-                    - GIF-worthy sequences
-                    - Exploitable templates
-
-                3. Virality Indicators
-                    - Universal humor/relatability
-                    - Clear emotional response triggers
-                    - Easy to remix/recontextualize
-                    - Cultural reference potential
-                    - Distinct visual hooks
-
-            Multimodal Data:
-            video: {chunk}
-            User Prompt: {prompt}
-
-        
-            """
-            chunk_prompt += """
-            **Output Format**: Return a JSON that containes the  fileds `clip_timestamps` and `image_timestamps`.
-            clip_timestamps is from the visual section of the input.
-            image_timestamps is the timestamp of the image in the visual section.
-            Ensure the final output strictly adheres to the JSON format specified without including additional text, explanations or any extra characters.
-            If there is no match return empty list without additional text. Use the following structure for your response:
-            {"clip_timestamps": [{"start": start timestamp of the clip, "end": end timestamp of the clip, "text":  "text content of the clip"}], "image_timestamps": [timestamp of the image]}
-            """
-            prompts.append(chunk_prompt)
-            i += 1
-
-        return self._prompt_runner(prompts)
+    def _normalize_times(self, entries):
+        """Cast the start and end of scenes or transcript entries to float once,
+        as they are compared many times while building the docs."""
+        for entry in entries:
+            entry["start"] = float(entry["start"])
+            entry["end"] = float(entry["end"])
+        return entries
 
     def _get_scenes(self, video_id):
         self.output_message.actions.append("Retrieving video scenes..")
@@ -171,8 +243,10 @@ class MemeMakerAgent(BaseAgent):
         scene_list = self.videodb_tool.list_scene_index(video_id)
         if scene_list:
             scene_index_id = scene_list[0]["scene_index_id"]
-            return scene_index_id, self.videodb_tool.get_scene_index(
-                video_id=video_id, scene_id=scene_index_id
+            return scene_index_id, self._normalize_times(
+                self.videodb_tool.get_scene_index(
+                    video_id=video_id, scene_id=scene_index_id
+                )
             )
         else:
             self.output_message.actions.append("Scene index not found")
@@ -183,18 +257,50 @@ class MemeMakerAgent(BaseAgent):
         self.output_message.actions.append("Retrieving video transcript..")
         self.output_message.push_update()
         try:
-            return self.videodb_tool.get_transcript(
-                video_id
-            ), self.videodb_tool.get_transcript(video_id, text=False)
+            transcript = self.videodb_tool.get_transcript(video_id, text=False)
         except Exception:
             self.output_message.actions.append(
                 "Transcript unavailable. Indexing spoken content."
             )
             self.output_message.push_update()
             self.videodb_tool.index_spoken_words(video_id)
-            return self.videodb_tool.get_transcript(
-                video_id
-            ), self.videodb_tool.get_transcript(video_id, text=False)
+            transcript = self.videodb_tool.get_transcript(video_id, text=False)
+        return self._normalize_times(transcript)
+
+    def _generate_clip_stream(self, video_id, clip):
+        # Clip keys are read on the worker, so a malformed clip from the LLM
+        # fails only its own stream.
+        return self.videodb_tool.generate_video_stream(
+            video_id=video_id,
+            timeline=[(clip["start"], clip["end"])],
+        )
+
+    def _stream_runner(self, video_id, clips, max_inflight=MAX_INFLIGHT_STREAMS):
+        """Generate the clip streams in parallel, keeping at most max_inflight
+        of them in flight, and yield (index, future) as each one completes."""
+        clip_indexes = iter(range(len(clips)))
+        future_to_index = {}
+
+        def submit_next():
+            index = next(clip_indexes, None)
+            if index is None:
+                return None
+            future = executor.submit(
+                self._generate_clip_stream, video_id, clips[index]
+            )
+            future_to_index[future] = index
+            return future
+
+        pending = {submit_next() for _ in range(max_inflight)} - {None}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                next_future = submit_next()
+                if next_future:
+                    pending.add(next_future)
+                yield future_to_index.pop(future), future
 
     def run(
         self, prompt: str, video_id: str, collection_id: str, *args, **kwargs
@@ -206,9 +312,9 @@ class MemeMakerAgent(BaseAgent):
         :rtype: AgentResponse
         """
         try:
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.videodb_tool = get_videodb_tool(collection_id)
             try:
-                _, transcript = self._get_transcript(video_id=video_id)
+                transcript = self._get_transcript(video_id=video_id)
                 scene_index_id, scenes = self._get_scenes(video_id=video_id)
 
                 self.output_message.actions.append("Identifying meme content..")
@@ -228,27 +334,34 @@ class MemeMakerAgent(BaseAgent):
             self.output_message.actions.append("Key moments identified..")
             self.output_message.actions.append("Creating video clips..")
             self.output_message.push_update()
-            data = {"clip_timestamps": [], "image_timestamps": []}
+            clips = result["clip_timestamps"]
+            data = {"clip_timestamps": clips, "image_timestamps": []}
             all_clips_generated: bool = True
-            for clip in result["clip_timestamps"]:
+            video_contents = []
+            for clip in clips:
                 video_content = VideoContent(
                     agent_name=self.agent_name,
                     status=MsgStatus.progress,
                     status_message="Generating clip..",
                 )
                 self.output_message.content.append(video_content)
+                video_contents.append(video_content)
+
+            # Streams are generated in parallel, the output message is only
+            # updated from this thread as each one completes.
+            for index, future in self._stream_runner(video_id, clips):
+                clip = clips[index]
+                video_content = video_contents[index]
                 try:
-                    stream_url = stream_url = self.videodb_tool.generate_video_stream(
-                        video_id=video_id,
-                        timeline=[(clip["start"], clip["end"])],
-                    )
+                    stream_url = future.result()
                 except Exception as e:
-                    video_content.status_message = f"Error generating stream: {str(e)}"
+                    video_content.status_message = (
+                        f"Error generating stream: {str(e)}"
+                    )
                     video_content.status = MsgStatus.error
                     self.output_message.push_update()
                     clip["stream_url"] = None
                     clip["error"] = f"Error generating stream: {str(e)}"
-                    data["clip_timestamps"].append(clip)
                     all_clips_generated = False
                     continue
 
@@ -256,7 +369,11 @@ class MemeMakerAgent(BaseAgent):
                 video_content.status_message = f'Clip "{clip["text"]}" generated.'
                 video_content.status = MsgStatus.success
                 clip["stream_url"] = stream_url
-                data["clip_timestamps"].append(clip)
+                self.output_message.push_update()
+
+            # Clips are streamed to the client as they finish, the message is
+            # saved once they are all done.
+            if clips:
                 self.output_message.publish()
 
         except Exception as e:
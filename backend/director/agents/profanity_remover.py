@@ -13,8 +13,7 @@ from director.core.session import (
     ContextMessage,
     RoleTypes,
 )
-from director.llm import get_default_llm
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +32,14 @@ class ProfanityRemoverAgent(BaseAgent):
             "If the user has not provided the optional parameter `beep_audio_id`, send it as `None` so defaults are picked from the environment."
         )
         self.parameters = self.get_parameters()
-        self.llm = get_default_llm()
         super().__init__(session=session, **kwargs)
 
     def add_beep(self, videodb_tool, video_id, beep_audio_id, timestamps):
         timeline = videodb_tool.get_and_set_timeline()
         video_asset = VideoAsset(asset_id=video_id)
         timeline.add_inline(video_asset)
+        beep = AudioAsset(asset_id=beep_audio_id)
         for start, _ in timestamps:
-            beep = AudioAsset(asset_id=beep_audio_id)
             timeline.add_overlay(start=start, asset=beep)
         stream_url = timeline.generate_stream()
         return stream_url
@@ -83,7 +81,7 @@ class ProfanityRemoverAgent(BaseAgent):
             )
             video_content.status_message = "Generating clean stream.."
             self.output_message.push_update()
-            videodb_tool = VideoDBTool(collection_id=collection_id)
+            videodb_tool = get_videodb_tool(collection_id)
             try:
                 transcript = videodb_tool.get_transcript(video_id, text=False)
             except Exception:
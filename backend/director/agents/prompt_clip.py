@@ -11,8 +11,7 @@ from director.core.session import (
     VideoContent,
     VideoData,
 )
-from director.tools.videodb_tool import VideoDBTool
-from director.llm import get_default_llm
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +46,6 @@ class PromptClipAgent(BaseAgent):
         # TODO: Improve this
         self.description = "Generates video clips based on user prompts. This agent uses AI to analyze the text of a video transcript and identify sentences relevant to the user prompt for making clips. It then generates video clips based on the identified sentences. Use this tool to create clips based on specific themes or topics from a video."
         self.parameters = PROMPTCLIP_AGENT_PARAMETERS
-        self.llm = get_default_llm()
         super().__init__(session=session, **kwargs)
 
     def _chunk_docs(self, docs, chunk_size):
@@ -260,7 +258,7 @@ class PromptClipAgent(BaseAgent):
         **kwargs,
     ) -> AgentResponse:
         try:
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.videodb_tool = get_videodb_tool(collection_id)
             result = []
             try:
                 if content_type == "spoken_content":
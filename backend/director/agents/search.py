@@ -1,7 +1,6 @@
 import logging
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
-from director.llm import get_default_llm
 from director.core.session import (
     Session,
     MsgStatus,
@@ -14,7 +13,7 @@ from director.core.session import (
     ContextMessage,
     RoleTypes,
 )
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +60,6 @@ class SearchAgent(BaseAgent):
     def __init__(self, session: Session, **kwargs):
         self.agent_name = "search"
         self.description = "Agent to search information from VideoDB collections. Mainly used with a collection of videos."
-        self.llm = get_default_llm()
         self.parameters = SEARCH_AGENT_PARAMETERS
         super().__init__(session=session, **kwargs)
 
@@ -93,7 +91,7 @@ class SearchAgent(BaseAgent):
             self.output_message.content.append(search_result_content)
             self.output_message.actions.append(f"Running {search_type} search on {index_type} index.")
             self.output_message.push_update()
-            videodb_tool = VideoDBTool(collection_id=collection_id)
+            videodb_tool = get_videodb_tool(collection_id)
             scene_index_id = None
             if index_type == "scene" and video_id:
                 scene_index_list = videodb_tool.list_scene_index(video_id)
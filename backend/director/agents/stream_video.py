@@ -2,7 +2,7 @@ import logging
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import Session, MsgStatus, VideoContent, VideoData
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +66,7 @@ class StreamVideoAgent(BaseAgent):
             )
             self.output_message.content.append(video_content)
             self.output_message.push_update()
-            videodb_tool = VideoDBTool(collection_id=collection_id)
+            videodb_tool = get_videodb_tool(collection_id)
             video_data = videodb_tool.get_video(video_id)
             stream_url = video_data.get("stream_url")
             video_content.video = VideoData(stream_url=stream_url)
@@ -11,8 +11,7 @@ from director.core.session import (
     VideoData,
     MsgStatus,
 )
-from director.tools.videodb_tool import VideoDBTool
-from director.llm import get_default_llm
+from director.tools.videodb_tool import get_videodb_tool
 
 
 from videodb.asset import VideoAsset, TextAsset, TextStyle
@@ -109,7 +108,6 @@ class SubtitleAgent(BaseAgent):
     def __init__(self, session: Session, **kwargs):
         self.agent_name = "subtitle"
         self.description = "An agent designed to add different languages subtitles to a specified video within VideoDB."
-        self.llm = get_default_llm()
         self.parameters = SUBTITLE_AGENT_PARAMETERS
         super().__init__(session=session, **kwargs)
 
@@ -185,7 +183,7 @@ class SubtitleAgent(BaseAgent):
         """
         try:
             self.video_id = video_id
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.videodb_tool = get_videodb_tool(collection_id)
 
             self.output_message.actions.append(
                 "Retrieving the subtitles in the video's original language"
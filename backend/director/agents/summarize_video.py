@@ -2,8 +2,7 @@ import logging
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import ContextMessage, RoleTypes, TextContent, MsgStatus
-from director.llm import get_default_llm
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +11,6 @@ class SummarizeVideoAgent(BaseAgent):
     def __init__(self, session=None, **kwargs):
         self.agent_name = "summarize_video"
         self.description = "This is an agent to summarize the given video of VideoDB, if the user wants a certain kind of summary the prompt is required."
-        self.llm = get_default_llm()
         self.parameters = self.get_parameters()
         super().__init__(session=session, **kwargs)
 
@@ -35,7 +33,7 @@ class SummarizeVideoAgent(BaseAgent):
             )
             self.output_message.content.append(output_text_content)
             self.output_message.push_update()
-            videodb_tool = VideoDBTool(collection_id=collection_id)
+            videodb_tool = get_videodb_tool(collection_id)
             try:
                 transcript_text = videodb_tool.get_transcript(video_id)
             except Exception:
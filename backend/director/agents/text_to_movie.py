@@ -2,8 +2,9 @@ import logging
 import os
 import json
 import uuid
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Optional, Dict, Tuple
+from dataclasses import dataclass, field
 
 from videodb.asset import VideoAsset, AudioAsset
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
@@ -15,7 +16,6 @@ from director.core.session import (
     RoleTypes,
     VideoData,
 )
-from director.llm import get_default_llm
 from director.tools.kling import KlingAITool, PARAMS_CONFIG as KLING_PARAMS_CONFIG
 from director.tools.stabilityai import (
     StabilityAITool,
@@ -25,8 +25,8 @@ from director.tools.elevenlabs import (
     ElevenLabsTool,
     PARAMS_CONFIG as ELEVENLABS_PARAMS_CONFIG,
 )
-from director.tools.videodb_tool import VideoDBTool
-from director.constants import DOWNLOADS_PATH
+from director.tools.videodb_tool import get_videodb_tool
+from director.constants import get_downloads_path
 
 
 logger = logging.getLogger(__name__)
@@ -86,6 +86,71 @@ TEXT_TO_MOVIE_AGENT_PARAMETERS = {
 }
 
 
+STYLE_AND_SCENES_PROMPT = """
+As a cinematographer, define a consistent visual style for a short film and
+break its storyline into 3 distinct scenes maintaining that style.
+The engine, preferred style, maximum scene duration and storyline are given
+in the user message.
+
+Return a JSON response with both the visual style and the scenes:
+{
+    "visual_style": {
+        "camera_setup": "Camera and lens combination",
+        "color_grading": "Color grading style and palette",
+        "lighting_style": "Core lighting approach",
+        "movement_style": "Camera movement philosophy",
+        "film_mood": "Overall atmospheric mood",
+        "director_reference": "Key director's style to reference",
+        "character_constants": {
+            "physical_description": "Consistent character details",
+            "costume_details": "Consistent costume elements"
+        },
+        "setting_constants": {
+            "time_period": "When this takes place",
+            "environment": "Core setting elements that stay consistent"
+        }
+    },
+    "scenes": [
+        {
+            "story_beat": "What happens in this scene",
+            "scene_description": "Visual description optimized for the engine, consistent with the visual style",
+            "suggested_duration": "Duration as integer in seconds (at most the maximum scene duration)"
+        }
+    ]
+}
+Make sure suggested_duration is a number, not a string.
+"""
+
+COMPRESSION_PROMPT = """
+Compress the prompt given in the user message to under 2450 characters while maintaining its structure and key information.
+Return only the compressed prompt.
+"""
+
+BATCH_COMPRESSION_PROMPT = """
+The user message is a JSON object with a "prompts" array.
+Compress each prompt to under 2450 characters while maintaining its structure and key information.
+Return a JSON response {"compressed": [...]} with exactly one compressed prompt per input prompt, in the same order.
+"""
+
+AUDIO_PROMPT = """
+As a composer, create a simple musical description for the story given in the user message, focusing ONLY on:
+- Main instrument/sound
+- One key mood change
+- Basic progression
+
+Keep it under 100 characters. No visual references or scene descriptions.
+Focus on the music.
+"""
+
+
+def remove_file(path: str):
+    """Remove a temporary file, ignoring it if it was never written."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 @dataclass
 class VideoGenResult:
     """Track results of video generation"""
@@ -115,6 +180,15 @@ class VisualStyle:
     director_reference: str
     character_constants: Dict
     setting_constants: Dict
+    character_constants_json: str = field(init=False, repr=False)
+    setting_constants_json: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Serialised once per movie and reused in every scene prompt
+        self.character_constants_json = json.dumps(
+            self.character_constants, indent=2
+        )
+        self.setting_constants_json = json.dumps(self.setting_constants, indent=2)
 
 
 class TextToMovieAgent(BaseAgent):
@@ -125,7 +199,6 @@ class TextToMovieAgent(BaseAgent):
             "Agent for generating movies from storylines using Gen AI models"
         )
         self.parameters = TEXT_TO_MOVIE_AGENT_PARAMETERS
-        self.llm = get_default_llm()
 
         self.engine_configs = {
             "kling": EngineConfig(
@@ -160,7 +233,7 @@ class TextToMovieAgent(BaseAgent):
         :return: AgentResponse containing information about generated movie
         """
         try:
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.videodb_tool = get_videodb_tool(collection_id)
             self.output_message.actions.append("Processing input...")
             video_content = VideoContent(
                 agent_name=self.agent_name,
@@ -204,15 +277,12 @@ class TextToMovieAgent(BaseAgent):
                 video_gen_config = text_to_movie.get(self.video_gen_config_key, {})
                 audio_gen_config = text_to_movie.get(self.audio_gen_config_key, {})
 
-                # Generate visual style
-                visual_style = self.generate_visual_style(raw_storyline)
-                print("These are visual styles", visual_style)
-
-                # Generate scenes
-                scenes = self.generate_scene_sequence(
-                    raw_storyline, visual_style, engine
+                # Generate visual style and scenes
+                visual_style, scenes = self.generate_style_and_scenes(
+                    raw_storyline, engine
                 )
-                print("These are scenes", scenes)
+                logger.debug("Visual style: %s", visual_style)
+                logger.debug("Scenes: %s", scenes)
 
                 self.output_message.actions.append(
                     f"Generating {len(scenes)} videos..."
@@ -220,77 +290,116 @@ class TextToMovieAgent(BaseAgent):
                 self.output_message.push_update()
 
                 engine_config = self.engine_configs[engine]
-                generated_videos_results = []
+                downloads_path = get_downloads_path()
 
-                # Generate videos sequentially
-                for index, scene in enumerate(scenes):
-                    self.output_message.actions.append(
-                        f"Generating video for scene {index + 1}..."
-                    )
-                    self.output_message.push_update()
+                # Generate engine-specific prompts
+                prompts = self.generate_engine_prompts(scenes, visual_style, engine)
 
+                def generate_scene_video(index, scene):
                     suggested_duration = min(
                         scene.get("suggested_duration", 5), engine_config.max_duration
                     )
-                    # Generate engine-specific prompt
-                    prompt = self.generate_engine_prompt(scene, visual_style, engine)
+                    prompt = prompts[index]
 
-                    print(f"Generating video for scene {index + 1}...")
-                    print("This is the prompt", prompt)
+                    logger.debug("Scene %s prompt: %s", index + 1, prompt)
 
-                    video_path = f"{DOWNLOADS_PATH}/{str(uuid.uuid4())}.mp4"
-                    os.makedirs(DOWNLOADS_PATH, exist_ok=True)
-
-                    self.video_gen_tool.text_to_video(
-                        prompt=prompt,
-                        save_at=video_path,
-                        duration=suggested_duration,
-                        config=video_gen_config,
-                    )
-                    generated_videos_results.append(
-                        VideoGenResult(
-                            step_index=index, video_path=video_path, success=True
+                    video_path = f"{downloads_path}/{str(uuid.uuid4())}.mp4"
+                    try:
+                        self.video_gen_tool.text_to_video(
+                            prompt=prompt,
+                            save_at=video_path,
+                            duration=suggested_duration,
+                            config=video_gen_config,
                         )
+                    except Exception:
+                        remove_file(video_path)
+                        raise
+                    return VideoGenResult(
+                        step_index=index, video_path=video_path, success=True
                     )
 
-                self.output_message.actions.append(
-                    f"Uploading {len(generated_videos_results)} videos to VideoDB..."
-                )
-                self.output_message.push_update()
-
-                # Process videos and track duration
-                total_duration = 0
-                for result in generated_videos_results:
-                    if result.success:
-                        self.output_message.actions.append(
-                            f"Uploading video {result.step_index + 1}..."
-                        )
-                        self.output_message.push_update()
-                        media = self.videodb_tool.upload(
+                def upload_scene_video(result):
+                    try:
+                        return self.videodb_tool.upload(
                             result.video_path,
                             source_type="file_path",
                             media_type="video",
                         )
-                        total_duration += float(media.get("length", 0))
-                        scenes[result.step_index]["video"] = media
-
+                    finally:
                         # Cleanup temporary files
-                        if os.path.exists(result.video_path):
-                            os.remove(result.video_path)
-                    else:
+                        remove_file(result.video_path)
+
+                # Scenes are independent remote jobs, so generate them
+                # concurrently and upload each one as soon as it is ready.
+                # Progress updates stay on this thread.
+                with ThreadPoolExecutor(max_workers=len(scenes) + 1) as executor:
+                    audio_prompt_future = executor.submit(
+                        self.generate_audio_prompt, raw_storyline
+                    )
+                    pending = {
+                        executor.submit(generate_scene_video, index, scene): (
+                            "generate",
+                            index,
+                        )
+                        for index, scene in enumerate(scenes)
+                    }
+                    failed_result = None
+                    total_duration = 0
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            stage, index = pending.pop(future)
+                            if future.cancelled():
+                                continue
+                            try:
+                                result = future.result()
+                            except Exception as e:
+                                if failed_result is None:
+                                    failed_result = VideoGenResult(
+                                        step_index=index,
+                                        video_path=None,
+                                        success=False,
+                                        error=f"{stage} failed: {e}",
+                                    )
+                                    # Stop queued work; jobs already running
+                                    # are drained below without uploading.
+                                    for pending_future in pending:
+                                        pending_future.cancel()
+                                continue
+
+                            if stage == "generate":
+                                if failed_result is not None:
+                                    remove_file(result.video_path)
+                                    continue
+                                self.output_message.actions.append(
+                                    f"Uploading video {index + 1} to VideoDB..."
+                                )
+                                self.output_message.push_update()
+                                upload_future = executor.submit(
+                                    upload_scene_video, result
+                                )
+                                pending[upload_future] = ("upload", index)
+                            else:
+                                # Process videos and track duration
+                                total_duration += float(result.get("length", 0))
+                                scenes[index]["video"] = result
+                                self.output_message.actions.append(
+                                    f"Uploaded video {index + 1}..."
+                                )
+                                self.output_message.push_update()
+
+                    if failed_result is not None:
                         raise Exception(
-                            f"Failed to generate video {result.step_index}: {result.error}"
+                            f"Failed to generate video {failed_result.step_index}: {failed_result.error}"
                         )
 
-                # Generate audio prompt
-                sound_effects_description = self.generate_audio_prompt(raw_storyline)
+                    sound_effects_description = audio_prompt_future.result()
 
                 self.output_message.actions.append("Generating background music...")
                 self.output_message.push_update()
 
                 # Generate and add sound effects
-                os.makedirs(DOWNLOADS_PATH, exist_ok=True)
-                sound_effects_path = f"{DOWNLOADS_PATH}/{str(uuid.uuid4())}.mp3"
+                sound_effects_path = f"{get_downloads_path()}/{str(uuid.uuid4())}.mp3"
 
                 self.audio_gen_tool.generate_sound_effect(
                     prompt=sound_effects_description,
@@ -308,8 +417,7 @@ class TextToMovieAgent(BaseAgent):
                     sound_effects_path, source_type="file_path", media_type="audio"
                 )
 
-                if os.path.exists(sound_effects_path):
-                    os.remove(sound_effects_path)
+                remove_file(sound_effects_path)
 
                 self.output_message.actions.append(
                     "Combining assets into final video..."
@@ -342,79 +450,31 @@ class TextToMovieAgent(BaseAgent):
                 status=AgentStatus.ERROR, message=f"Agent failed with error: {str(e)}"
             )
 
-    def generate_visual_style(self, storyline: str) -> VisualStyle:
-        """Generate consistent visual style for entire film."""
-        style_prompt = f"""
-        As a cinematographer, define a consistent visual style for this short film:
-        Storyline: {storyline}
-        
-        Return a JSON response with visual style parameters:
-        {{
-            "camera_setup": "Camera and lens combination",
-            "color_grading": "Color grading style and palette",
-            "lighting_style": "Core lighting approach",
-            "movement_style": "Camera movement philosophy",
-            "film_mood": "Overall atmospheric mood",
-            "director_reference": "Key director's style to reference",
-            "character_constants": {{
-                "physical_description": "Consistent character details",
-                "costume_details": "Consistent costume elements"
-            }},
-            "setting_constants": {{
-                "time_period": "When this takes place",
-                "environment": "Core setting elements that stay consistent"
-            }}
-        }}
-        """
-
-        style_message = ContextMessage(content=style_prompt, role=RoleTypes.user)
-        llm_response = self.llm.chat_completions(
-            [style_message.to_llm_msg()], response_format={"type": "json_object"}
-        )
-        return VisualStyle(**json.loads(llm_response.content))
-
-    def generate_scene_sequence(
-        self, storyline: str, style: VisualStyle, engine: str
-    ) -> List[dict]:
-        """Generate 3-5 scenes with visual and narrative consistency."""
+    def generate_style_and_scenes(
+        self, storyline: str, engine: str
+    ) -> Tuple[VisualStyle, List[dict]]:
+        """Generate a consistent visual style and 3-5 scenes in a single call."""
         engine_config = self.engine_configs[engine]
 
-        sequence_prompt = f"""
-        Break this storyline into 3 distinct scenes maintaining visual consistency.
-        Generate scene descriptions optimized for {engine} {engine_config.preferred_style} style.
-        
-        Visual Style:
-        - Camera/Lens: {style.camera_setup}
-        - Color Grade: {style.color_grading}
-        - Lighting: {style.lighting_style}
-        - Movement: {style.movement_style}
-        - Mood: {style.film_mood}
-        - Director Style: {style.director_reference}
-        
-        Character Constants:
-        {json.dumps(style.character_constants, indent=2)}
-        
-        Setting Constants:
-        {json.dumps(style.setting_constants, indent=2)}
-        
+        prompt = f"""
+        Engine: {engine}
+        Preferred style: {engine_config.preferred_style}
         Maximum duration per scene: {engine_config.max_duration} seconds
-        
-        Storyline: {storyline}
 
-        Return a JSON array of scenes with:
-        {{
-            "story_beat": "What happens in this scene",
-            "scene_description": "Visual description optimized for {engine}",
-            "suggested_duration": "Duration as integer in seconds (max {engine_config.max_duration})"
-        }}
-        Make sure suggested_duration is a number, not a string.
+        Storyline: {storyline}
         """
 
-        sequence_message = ContextMessage(content=sequence_prompt, role=RoleTypes.user)
+        system_message = ContextMessage(
+            content=STYLE_AND_SCENES_PROMPT, role=RoleTypes.system
+        )
+        message = ContextMessage(content=prompt, role=RoleTypes.user)
         llm_response = self.llm.chat_completions(
-            [sequence_message.to_llm_msg()], response_format={"type": "json_object"}
+            [system_message.to_llm_msg(), message.to_llm_msg()],
+            response_format={"type": "json_object"},
         )
-        scenes_data = json.loads(llm_response.content)["scenes"]
+        data = json.loads(llm_response.content)
+        style = VisualStyle(**data["visual_style"])
+        scenes_data = data["scenes"]
 
         # Ensure durations are integers
         for scene in scenes_data:
@@ -423,7 +483,7 @@ class TextToMovieAgent(BaseAgent):
             except (ValueError, TypeError):
                 scene["suggested_duration"] = 5
 
-        return scenes_data
+        return style, scenes_data
 
     def generate_engine_prompt(
         self, scene: dict, style: VisualStyle, engine: str
@@ -438,17 +498,69 @@ class TextToMovieAgent(BaseAgent):
             Photorealistic, detailed, high quality, masterful composition.
             """
         else:  # Kling
-            initial_prompt = f"""
+            initial_prompt = self._kling_prompt(scene, style)
+
+            # Run through LLM to compress while maintaining structure
+            system_message = ContextMessage(
+                content=COMPRESSION_PROMPT, role=RoleTypes.system
+            )
+            compression_message = ContextMessage(
+                content=initial_prompt, role=RoleTypes.user
+            )
+            llm_response = self.llm.chat_completions(
+                [system_message.to_llm_msg(), compression_message.to_llm_msg()],
+                response_format={"type": "text"},
+            )
+            return llm_response.content
+
+    def generate_engine_prompts(
+        self, scenes: List[dict], style: VisualStyle, engine: str
+    ) -> List[str]:
+        """Generate engine-specific prompts for all scenes, in scene order"""
+        if engine == "stabilityai":
+            return [
+                self.generate_engine_prompt(scene, style, engine) for scene in scenes
+            ]
+
+        # Compress all Kling prompts in one LLM call
+        initial_prompts = [self._kling_prompt(scene, style) for scene in scenes]
+        system_message = ContextMessage(
+            content=BATCH_COMPRESSION_PROMPT, role=RoleTypes.system
+        )
+        compression_message = ContextMessage(
+            content=json.dumps({"prompts": initial_prompts}), role=RoleTypes.user
+        )
+        try:
+            llm_response = self.llm.chat_completions(
+                [system_message.to_llm_msg(), compression_message.to_llm_msg()],
+                response_format={"type": "json_object"},
+            )
+            compressed = json.loads(llm_response.content)["compressed"]
+            if len(compressed) == len(scenes) and all(
+                isinstance(prompt, str) and 0 < len(prompt) <= 2500
+                for prompt in compressed
+            ):
+                return compressed
+            logger.warning(
+                "Batch compression returned unusable prompts, compressing per scene"
+            )
+        except Exception as e:
+            logger.warning(f"Batch compression failed, compressing per scene: {e}")
+
+        return [self.generate_engine_prompt(scene, style, engine) for scene in scenes]
+
+    def _kling_prompt(self, scene: dict, style: VisualStyle) -> str:
+        return f"""
             {style.director_reference} style shot. 
             Filmed on {style.camera_setup}.
             
             {scene['scene_description']}
             
             Character Details:
-            {json.dumps(style.character_constants, indent=2)}
+            {style.character_constants_json}
             
             Setting Elements:
-            {json.dumps(style.setting_constants, indent=2)}
+            {style.setting_constants_json}
             
             {style.lighting_style} lighting.
             {style.color_grading} color palette.
@@ -457,38 +569,15 @@ class TextToMovieAgent(BaseAgent):
             Mood: {style.film_mood}
             """
 
-            # Run through LLM to compress while maintaining structure
-            compression_prompt = f"""
-            Compress the following prompt to under 2450 characters while maintaining its structure and key information:
-
-            {initial_prompt}
-            """
-
-            compression_message = ContextMessage(
-                content=compression_prompt, role=RoleTypes.user
-            )
-            llm_response = self.llm.chat_completions(
-                [compression_message.to_llm_msg()], response_format={"type": "text"}
-            )
-            return llm_response.content
-
     def generate_audio_prompt(self, storyline: str) -> str:
         """Generate minimal, music-focused prompt for ElevenLabs."""
-        audio_prompt = f"""
-        As a composer, create a simple musical description focusing ONLY on:
-        - Main instrument/sound
-        - One key mood change
-        - Basic progression
-        
-        Keep it under 100 characters. No visual references or scene descriptions.
-        Focus on the music.
-        
-        Story context: {storyline}
-        """
-
-        prompt_message = ContextMessage(content=audio_prompt, role=RoleTypes.user)
+        system_message = ContextMessage(content=AUDIO_PROMPT, role=RoleTypes.system)
+        prompt_message = ContextMessage(
+            content=f"Story context: {storyline}", role=RoleTypes.user
+        )
         llm_response = self.llm.chat_completions(
-            [prompt_message.to_llm_msg()], response_format={"type": "text"}
+            [system_message.to_llm_msg(), prompt_message.to_llm_msg()],
+            response_format={"type": "text"},
         )
         return llm_response.content[:100]
 
@@ -1,12 +1,64 @@
 import logging
+import concurrent.futures
+import threading
+
+from functools import lru_cache
 
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 
 from director.core.session import Session, MsgStatus, ImageContent, ImageData
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=256)
+def generate_thumbnail(collection_id, video_id, timestamp, version=0):
+    """Generate the thumbnail for a video at the given timestamp. Each
+    generation adds an image to the collection, so a repeat request for the
+    same frame returns that image instead of extracting it again. version is
+    only part of the cache key, bumping it forces a fresh generation."""
+    return get_videodb_tool(collection_id).generate_thumbnail(
+        video_id=video_id, timestamp=timestamp
+    )
+
+
+# Thumbnails currently being generated, so concurrent requests for the same
+# frame wait on the first one instead of each extracting it.
+inflight_thumbnails = {}
+inflight_lock = threading.Lock()
+
+# Cache version per frame, bumped when a caller asks to bypass the cache, e.g.
+# because the cached image was deleted from the collection.
+thumbnail_versions = {}
+
+
+def get_thumbnail(collection_id, video_id, timestamp, cache_bust=False):
+    """Get the thumbnail for a video at the given timestamp, sharing a single
+    generation between concurrent callers. With cache_bust, the cached image
+    is skipped and a new one is generated and cached in its place."""
+    frame = (collection_id, video_id, timestamp)
+    with inflight_lock:
+        if cache_bust:
+            thumbnail_versions[frame] = thumbnail_versions.get(frame, 0) + 1
+        key = frame + (thumbnail_versions.get(frame, 0),)
+        future = inflight_thumbnails.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = concurrent.futures.Future()
+            inflight_thumbnails[key] = future
+
+    if is_leader:
+        try:
+            future.set_result(generate_thumbnail(*key))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with inflight_lock:
+                inflight_thumbnails.pop(key, None)
+    return future.result()
+
+
 THUMBNAIL_AGENT_PARAMETERS = {
     "type": "object",
     "properties": {
@@ -22,6 +74,11 @@ THUMBNAIL_AGENT_PARAMETERS = {
             "type": "integer",
             "description": "Timestamp in seconds of the video to generate thumbnail, Optional parameter don't ask from user",
         },
+        "cache_bust": {
+            "type": "boolean",
+            "description": "Generate a new thumbnail even if one was already generated for this frame. Only set when the user says the previous thumbnail is missing or broken.",
+            "default": False,
+        },
     },
     "required": ["collection_id", "video_id"],
 }
@@ -35,7 +92,13 @@ class ThumbnailAgent(BaseAgent):
         super().__init__(session=session, **kwargs)
 
     def run(
-        self, collection_id: str, video_id: str, timestamp: int = 5, *args, **kwargs
+        self,
+        collection_id: str,
+        video_id: str,
+        timestamp: int = 5,
+        cache_bust: bool = False,
+        *args,
+        **kwargs,
     ) -> AgentResponse:
         """
         Get the thumbnail for the video at the given timestamp
@@ -47,9 +110,8 @@ class ThumbnailAgent(BaseAgent):
             self.output_message.content.append(image_content)
             self.output_message.push_update()
 
-            videodb_tool = VideoDBTool(collection_id=collection_id)
-            thumbnail_data = videodb_tool.generate_thumbnail(
-                video_id=video_id, timestamp=timestamp
+            thumbnail_data = get_thumbnail(
+                collection_id, video_id, float(timestamp), cache_bust=cache_bust
             )
             image_content.image = ImageData(**thumbnail_data)
             image_content.status = MsgStatus.success
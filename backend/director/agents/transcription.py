@@ -1,7 +1,7 @@
 import logging
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import TextContent, MsgStatus
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ class TranscriptionAgent(BaseAgent):
         self.output_message.content.append(output_text_content)
         self.output_message.push_update()
 
-        videodb_tool = VideoDBTool(collection_id=collection_id)
+        videodb_tool = get_videodb_tool(collection_id)
         video_info = videodb_tool.get_video(video_id)
         video_length = int(video_info["length"]) 
 
@@ -10,7 +10,7 @@ from director.core.session import (
     TextContent,
     VideoData,
 )
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 
 logger = logging.getLogger(__name__)
 
@@ -156,7 +156,7 @@ class UploadAgent(BaseAgent):
         :return: AgentResponse - The response containing information about the upload operation.
         """
 
-        self.videodb_tool = VideoDBTool(collection_id=collection_id)
+        self.videodb_tool = get_videodb_tool(collection_id)
 
         if source_type == "local_file":
             return self._upload(source, source_type, media_type, name)
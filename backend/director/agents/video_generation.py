@@ -5,10 +5,12 @@ import asyncio
 
 from typing import Optional
 
+from dotenv import load_dotenv
+
 from director.utils.asyncio import is_event_loop_running
 from director.agents.base import BaseAgent, AgentResponse, AgentStatus
 from director.core.session import Session, VideoContent, VideoData, MsgStatus
-from director.tools.videodb_tool import VideoDBTool
+from director.tools.videodb_tool import get_videodb_tool
 from director.tools.stabilityai import (
     StabilityAITool,
     PARAMS_CONFIG as STABILITYAI_PARAMS_CONFIG,
@@ -17,10 +19,14 @@ from director.tools.fal_video import (
     FalVideoGenerationTool,
     PARAMS_CONFIG as FAL_VIDEO_GEN_PARAMS_CONFIG,
 )
-from director.constants import DOWNLOADS_PATH
+from director.constants import get_downloads_path
 
+load_dotenv()
 logger = logging.getLogger(__name__)
 
+STABILITYAI_API_KEY = os.getenv("STABILITYAI_API_KEY")
+FAL_KEY = os.getenv("FAL_KEY")
+
 SUPPORTED_ENGINES = ["stabilityai", "fal"]
 
 VIDEO_GENERATION_AGENT_PARAMETERS = {
@@ -106,7 +112,7 @@ class VideoGenerationAgent(BaseAgent):
         :return: Response containing the generated video ID
         """
         try:
-            self.videodb_tool = VideoDBTool(collection_id=collection_id)
+            self.videodb_tool = get_videodb_tool(collection_id)
             stealth_mode = kwargs.get("stealth_mode", False)
 
             if engine not in SUPPORTED_ENGINES:
@@ -121,13 +127,11 @@ class VideoGenerationAgent(BaseAgent):
                 self.output_message.content.append(video_content)
 
             if engine == "stabilityai":
-                STABILITYAI_API_KEY = os.getenv("STABILITYAI_API_KEY")
                 if not STABILITYAI_API_KEY:
                     raise Exception("Stability AI API key not found")
                 video_gen_tool = StabilityAITool(api_key=STABILITYAI_API_KEY)
                 config_key = "stabilityai_config"
             elif engine == "fal":
-                FAL_KEY = os.getenv("FAL_KEY")
                 if not FAL_KEY:
                     raise Exception("FAL API key not found")
                 video_gen_tool = FalVideoGenerationTool(api_key=FAL_KEY)
@@ -135,9 +139,8 @@ class VideoGenerationAgent(BaseAgent):
             else:
                 raise Exception(f"{engine} not supported")
 
-            os.makedirs(DOWNLOADS_PATH, exist_ok=True)
             output_file_name = f"video_{job_type}_{str(uuid.uuid4())}.mp4"
-            output_path = f"{DOWNLOADS_PATH}/{output_file_name}"
+            output_path = f"{get_downloads_path()}/{output_file_name}"
 
             if job_type == "text_to_video":
                 prompt = text_to_video.get("prompt")
@@ -186,14 +189,12 @@ class VideoGenerationAgent(BaseAgent):
             )
             video_content.status = MsgStatus.success
             video_content.status_message = "Here is your generated video"
-            self.output_message.push_update()
             self.output_message.publish()
 
         except Exception as e:
             logger.exception(f"Error in {self.agent_name} agent: {e}")
             video_content.status = MsgStatus.error
             video_content.status_message = "Failed to generate video"
-            self.output_message.push_update()
             self.output_message.publish()
             return AgentResponse(status=AgentStatus.ERROR, message=str(e))
 
@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 
 
@@ -29,3 +30,9 @@ class EnvPrefix(str, Enum):
     ANTHROPIC_ = "ANTHROPIC_"
 
 DOWNLOADS_PATH="director/downloads"
+
+
+def get_downloads_path():
+    """Return DOWNLOADS_PATH, creating the directory if it doesn't exist."""
+    os.makedirs(DOWNLOADS_PATH, exist_ok=True)
+    return DOWNLOADS_PATH
@@ -105,6 +105,8 @@ class ReasoningEngine:
         self.max_iterations = 10
         self.llm = get_default_llm()
         self.agents: List[BaseAgent] = []
+        self.agents_by_name = {}
+        self.tools = []
         self.stop_flag = False
         self.output_message: OutputMessage = self.session.output_message
         self.summary_content = None
@@ -116,6 +118,7 @@ class ReasoningEngine:
         :param agents: The list of agents to register.
         """
         self.agents.extend(agents)
+        self.agents_by_name.update({agent.agent_name: agent for agent in agents})
 
     def build_context(self):
         """Build the context for the reasoning engine it adds the information about the video or collection to the reasoning context."""
@@ -184,12 +187,10 @@ class ReasoningEngine:
         :param kwargs: The keyword arguments to pass to the agent
         :return: The response from the agent
         """
-        print("-" * 40, f"Running {agent_name} Agent", "-" * 40)
-        print(kwargs, "\n\n")
+        logger.info("Running %s agent", agent_name)
+        logger.debug("Agent arguments: %s", kwargs)
 
-        agent = next(
-            (agent for agent in self.agents if agent.agent_name == agent_name), None
-        )
+        agent = self.agents_by_name.get(agent_name)
         self.output_message.actions.append(f"Running @{agent_name} agent")
         self.output_message.agents.append(agent_name)
         self.output_message.push_update()
@@ -213,17 +214,13 @@ class ReasoningEngine:
             tries += 1
             if tries > max_tries:
                 break
-            print("-" * 40, "Context", "-" * 40)
-            print(
-                [message.to_llm_msg() for message in self.session.reasoning_context],
-                "\n\n",
-            )
+            context_messages = [
+                message.to_llm_msg() for message in self.session.reasoning_context
+            ]
+            logger.debug("Reasoning context: %s", context_messages)
             llm_response: LLMResponse = self.llm.chat_completions(
-                messages=[
-                    message.to_llm_msg() for message in self.session.reasoning_context
-                ]
-                + temp_messages,
-                tools=[agent.to_llm_format() for agent in self.agents],
+                messages=context_messages + temp_messages,
+                tools=self.tools,
             )
             logger.info(f"LLM Response: {llm_response}")
 
@@ -267,8 +264,7 @@ class ReasoningEngine:
                             role=RoleTypes.tool,
                         )
                     )
-                    print("-" * 40, "Agent Response", "-" * 40)
-                    print(agent_response, "\n\n")
+                    logger.debug("Agent response: %s", agent_response)
                     status = agent_response.status
 
             if not self.summary_content:
@@ -313,7 +309,7 @@ class ReasoningEngine:
                     self.summary_content.status_message = "Final Cut"
                 self.output_message.status = MsgStatus.success
                 self.output_message.publish()
-                print("-" * 40, "Stopping", "-" * 40)
+                logger.debug("Stopping reasoning engine")
                 self.stop()
                 break
 
@@ -323,6 +319,7 @@ class ReasoningEngine:
         :param int max_iterations: The number of max_iterations to run the reasoning engine
         """
         self.iterations = max_iterations or self.max_iterations
+        self.tools = [agent.to_llm_format() for agent in self.agents]
         self.build_context()
         self.output_message.actions.append("Reasoning the message..")
         self.output_message.push_update()
@@ -330,7 +327,7 @@ class ReasoningEngine:
         it = 0
         while self.iterations > 0:
             self.iterations -= 1
-            print("-" * 40, "Reasoning Engine Iteration", it, "-" * 40)
+            logger.debug("Reasoning engine iteration %s", it)
             if self.stop_flag:
                 break
 
@@ -338,4 +335,4 @@ class ReasoningEngine:
             it = it + 1
 
         self.session.save_context_messages()
-        print("-" * 40, "Reasoning Engine Finished", "-" * 40)
+        logger.debug("Reasoning engine finished")
@@ -62,7 +62,15 @@ class AnthropicAI(BaseLLM):
         system = ""
         formatted_messages = []
         if messages[0]["role"] == RoleTypes.system:
-            system = messages[0]["content"]
+            # The system prompt (with the tools ahead of it) is the same on every
+            # step of a run, mark it so Anthropic can serve it from its prompt cache.
+            system = [
+                {
+                    "type": "text",
+                    "text": messages[0]["content"],
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
             messages = messages[1:]
 
         for message in messages:
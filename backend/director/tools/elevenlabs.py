@@ -1,9 +1,28 @@
+import logging
 import time
 from typing import Optional
 
+import httpx
+
 from elevenlabs.client import ElevenLabs
 from elevenlabs import VoiceSettings
 
+logger = logging.getLogger(__name__)
+
+# Stream large media in 1 MiB chunks through a 4 MiB write buffer so a
+# multi-hundred-MB file doesn't turn into thousands of tiny reads and writes.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Shared by all ElevenLabsTool instances so dub polling, downloads and TTS
+# calls reuse keep-alive connections instead of a new TLS handshake each time.
+HTTP_TIMEOUT = 240
+http_client = httpx.Client(
+    timeout=HTTP_TIMEOUT,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
+
 PARAMS_CONFIG = {
     "sound_effect": {
         "prompt_influence": {
@@ -92,7 +111,9 @@ PARAMS_CONFIG = {
 class ElevenLabsTool:
     def __init__(self, api_key: str):
         if api_key:
-            self.client = ElevenLabs(api_key=api_key)
+            self.client = ElevenLabs(
+                api_key=api_key, timeout=HTTP_TIMEOUT, httpx_client=http_client
+            )
         else:
             raise Exception("ElevenLabs API key not found")
         self.voice_settings = VoiceSettings(
@@ -115,8 +136,9 @@ class ElevenLabsTool:
                     duration, self.constrains["sound_effect"]["max_duration"]
                 ),
                 prompt_influence=config.get("prompt_influence", 0.3),
+                request_options={"chunk_size": DOWNLOAD_CHUNK_SIZE},
             )
-            with open(save_at, "wb") as f:
+            with open(save_at, "wb", buffering=WRITE_BUFFER_SIZE) as f:
                 for chunk in result:
                     f.write(chunk)
         except Exception as e:
@@ -135,8 +157,9 @@ class ElevenLabsTool:
                     style=config.get("style", 0.0),
                     use_speaker_boost=config.get("use_speaker_boost", True),
                 ),
+                request_options={"chunk_size": DOWNLOAD_CHUNK_SIZE},
             )
-            with open(save_at, "wb") as f:
+            with open(save_at, "wb", buffering=WRITE_BUFFER_SIZE) as f:
                 for chunk in response:
                     if chunk:
                         f.write(chunk)
@@ -182,7 +205,7 @@ class ElevenLabsTool:
                 metadata = self.client.dubbing.get_dubbing_project_metadata(
                     dubbing_id
                 )
-                print("this is metadata", metadata)
+                logger.debug("Dubbing metadata: %s", metadata)
                 if metadata.status == "dubbed":
                     return True
                 elif metadata.status == "dubbing":
@@ -190,7 +213,7 @@ class ElevenLabsTool:
                 else:
                     return False
             except Exception as e:
-                print(f"Error checking dubbing status: {str(e)}")
+                logger.error(f"Error checking dubbing status: {str(e)}")
                 return False
         return False
 
@@ -199,12 +222,14 @@ class ElevenLabsTool:
     ) -> Optional[str]:
         """Download the dubbed file."""
         try:
-            with open(output_path, "wb") as file:
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as file:
                 for chunk in self.client.dubbing.get_dubbed_file(
-                    dubbing_id, language_code
+                    dubbing_id,
+                    language_code,
+                    request_options={"chunk_size": DOWNLOAD_CHUNK_SIZE},
                 ):
                     file.write(chunk)
             return output_path
         except Exception as e:
-            print(f"Error downloading dubbed file: {str(e)}")
+            logger.error(f"Error downloading dubbed file: {str(e)}")
             return None
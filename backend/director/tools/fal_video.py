@@ -3,6 +3,10 @@ import aiohttp
 
 from director.utils.asyncio import is_event_loop_running
 
+# Stream generated videos to disk in 1 MiB chunks rather than reading the
+# whole file into memory first.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 PARAMS_CONFIG = {
     "text_to_video": {
         "model_name": {
@@ -94,7 +98,10 @@ class FalVideoGenerationTool:
                         # Download the video
                         async with session.get(video_url) as video_response:
                             with open(save_at, "wb") as f:
-                                f.write(await video_response.read())
+                                async for chunk in video_response.content.iter_chunked(
+                                    DOWNLOAD_CHUNK_SIZE
+                                ):
+                                    f.write(chunk)
                         break
                     else:
                         raise ValueError(
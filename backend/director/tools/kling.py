@@ -1,3 +1,4 @@
+import logging
 import requests
 import time
 import jwt
@@ -5,6 +6,8 @@ import asyncio
 
 from director.utils.asyncio import is_event_loop_running
 
+logger = logging.getLogger(__name__)
+
 PARAMS_CONFIG = {
     "text_to_video": {
         "model": {
@@ -171,7 +174,7 @@ class KlingAITool:
             )
             response.raise_for_status()
 
-            print("Kling Response", response)
+            logger.debug("Kling response: %s", response)
 
             status = response.json()["data"]["task_status"]
 
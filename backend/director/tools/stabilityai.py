@@ -1,3 +1,4 @@
+import logging
 import requests
 import time
 import asyncio
@@ -6,6 +7,8 @@ import io
 
 from director.utils.asyncio import is_event_loop_running
 
+logger = logging.getLogger(__name__)
+
 PARAMS_CONFIG = {
     "text_to_video": {
         "strength": {
@@ -130,7 +133,7 @@ class StabilityAITool:
 
             result_response.raise_for_status()
 
-            print("StabilityAI Response", result_response)
+            logger.debug("StabilityAI response: %s", result_response)
 
             if result_response.status_code == 202:
                 # Still processing
@@ -2,10 +2,15 @@ import os
 import requests
 import videodb
 
+from functools import lru_cache
+
 from videodb import SearchType, SubtitleStyle, IndexType, SceneExtractionType
 from videodb.timeline import Timeline
 from videodb.asset import VideoAsset, ImageAsset
 
+# Reused for direct uploads so they share keep-alive connections
+http_session = requests.Session()
+
 
 class VideoDBTool:
     def __init__(self, collection_id="default"):
@@ -15,7 +20,6 @@ class VideoDBTool:
         self.collection = None
         if collection_id:
             self.collection = self.conn.get_collection(collection_id)
-        self.timeline = None
 
     def get_collection(self):
         return {
@@ -88,7 +92,7 @@ class VideoDBTool:
             )
             upload_url = upload_url_data.get("upload_url")
             files = {"file": (name, source)}
-            response = requests.post(upload_url, files=files)
+            response = http_session.post(upload_url, files=files)
             response.raise_for_status()
             upload_args["url"] = upload_url
         else:
@@ -217,12 +221,18 @@ class VideoDBTool:
         return stream_url
 
     def get_and_set_timeline(self):
-        self.timeline = Timeline(self.conn)
-        return self.timeline
+        # The tool is shared across runs, so each caller gets its own
+        # timeline rather than one stored on the instance.
+        return Timeline(self.conn)
 
     def add_subtitle(self, video_id, style: SubtitleStyle = SubtitleStyle()):
         video = self.collection.get_video(video_id)
         stream_url = video.add_subtitle(style)
         return stream_url
-    
 
+
+@lru_cache(maxsize=128)
+def get_videodb_tool(collection_id="default"):
+    """Get a VideoDBTool for the collection, shared across agent runs so the
+    connection and collection lookup are reused."""
+    return VideoDBTool(collection_id=collection_id)